@@ -9,7 +9,7 @@ from app.services.openai_service import responses
 logger = logging.getLogger(__name__)
 
 
-def generate_all_metrics(
+async def generate_all_metrics(
     user_prompt: str, activity_logs: List[TogglTimeEntry]
 ) -> List[ActivityMetric]:
     """
@@ -30,6 +30,10 @@ def generate_all_metrics(
         f"Generating metrics from {len(activity_logs)} activity logs with prompt: {user_prompt}"
     )
 
+    if not activity_logs:
+        logger.info("No activity logs provided, skipping LLM call")
+        return []
+
     response_format = _build_response_format()
 
     prompt = build_metric_generator_prompt(
@@ -38,21 +42,23 @@ def generate_all_metrics(
         response_format=response_format,
     )
 
-    logger.info(
-        f"Calling OpenAI Responses API to generate metrics with prompt: {prompt}"
-    )
-    response = responses(
+    logger.info("Calling OpenAI Responses API to generate metrics")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Metric generator prompt: {prompt}")
+    response = await responses(
         model="gpt-5-mini",
         input_text=prompt,
     )
 
     output_text = response["output_text"]
-    logger.info(f"Received raw response from LLM: {output_text}")
     logger.info(f"Received response from LLM: {len(output_text)} characters")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Received raw response from LLM: {output_text}")
 
     metrics = _parse_llm_response(output_text)
-    logger.info(f"Metrics: {metrics}")
     logger.info(f"Parsed {len(metrics)} metrics from LLM response")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Metrics: {metrics}")
 
     return metrics
 
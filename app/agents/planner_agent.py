@@ -3,6 +3,21 @@ from app.models.plan import Workflow, Step
 
 logger = logging.getLogger(__name__)
 
+# TODO: As of Dec. 2025, this is unused.  In the future, we want to
+# 1) Use LLM to determine plan and 2) use Amazon State Language.
+# See: https://states-language.net/spec.html#states-fields
+_DEFAULT_WORKFLOW = Workflow(
+    start="Foo",
+    graph=[
+        Step(
+            step_name="Foo",
+            step_description="Foo",
+            tool_name="Foo",
+            next_step_name="END",
+        ),
+    ],
+)
+
 
 def handle_request(prompt: str) -> Workflow:
     """
@@ -16,19 +31,4 @@ def handle_request(prompt: str) -> Workflow:
     """
     logger.info(f"Planner agent processing request: {prompt}")
 
-    # TODO: As of Dec. 2025, this is unused.  In the future, we want to
-    # 1) Use LLM to determine plan and 2) use Amazon State Language.
-    # See: https://states-language.net/spec.html#states-fields
-    workflow = Workflow(
-        start="Foo",
-        graph=[
-            Step(
-                step_name="Foo",
-                step_description="Foo",
-                tool_name="Foo",
-                next_step_name="END",
-            ),
-        ],
-    )
-
-    return workflow
+    return _DEFAULT_WORKFLOW
@@ -1,6 +1,28 @@
-from typing import List
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from app.models.toggl import TogglTimeEntry
 
+# (tags, description, start, start offset, stop, stop offset, duration)
+_ActivityLogKey = Tuple[
+    Tuple[str, ...],
+    str,
+    datetime,
+    Optional[timedelta],
+    datetime,
+    Optional[timedelta],
+    int,
+]
+
+_ACTIVITY_LOG_TEMPLATE = (
+    "Entry {index}:\n"
+    "  - Tags: {tags}\n"
+    "  - Description: {description}\n"
+    "  - Start: {start}\n"
+    "  - Stop: {stop}\n"
+    "  - Duration: {duration} seconds ({duration_minutes:.2f} minutes)"
+)
+
 
 def build_metric_generator_prompt(
     primary_objective: str,
@@ -63,20 +85,53 @@ def _format_activity_logs(activity_logs: List[TogglTimeEntry]) -> str:
     """
     Format activity logs into a readable string format.
 
+    The same activity logs are formatted once per objective by the workflow,
+    so formatting is memoized on a hashable snapshot of the entries. UTC
+    offsets are part of the key because equal instants in different timezones
+    compare equal but format differently.
+
     Args:
         activity_logs: List of TogglTimeEntry objects
 
     Returns:
         Formatted string representation of activity logs
     """
-    formatted_entries = []
-    for i, entry in enumerate(activity_logs, 1):
-        entry_str = f"""Entry {i}:
-  - Tags: {', '.join(entry.tags) if entry.tags else 'None'}
-  - Description: {entry.description}
-  - Start: {entry.start.isoformat()}
-  - Stop: {entry.stop.isoformat()}
-  - Duration: {entry.duration} seconds ({entry.duration / 60:.2f} minutes)"""
-        formatted_entries.append(entry_str)
-
-    return "\n\n".join(formatted_entries)
+    return _format_activity_log_keys(
+        tuple(
+            (
+                tuple(entry.tags),
+                entry.description,
+                entry.start,
+                entry.start.utcoffset(),
+                entry.stop,
+                entry.stop.utcoffset(),
+                entry.duration,
+            )
+            for entry in activity_logs
+        )
+    )
+
+
+@lru_cache(maxsize=64)
+def _format_activity_log_keys(entries: Tuple[_ActivityLogKey, ...]) -> str:
+    """
+    Format hashable activity log snapshots into a readable string format.
+
+    Args:
+        entries: Tuple of activity log snapshots built by _format_activity_logs
+
+    Returns:
+        Formatted string representation of activity logs
+    """
+    return "\n\n".join(
+        _ACTIVITY_LOG_TEMPLATE.format(
+            index=i,
+            tags=", ".join(tags) if tags else "None",
+            description=description,
+            start=start.isoformat(),
+            stop=stop.isoformat(),
+            duration=duration,
+            duration_minutes=duration / 60,
+        )
+        for i, (tags, description, start, _, stop, _, duration) in enumerate(entries, 1)
+    )
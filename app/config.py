@@ -1,5 +1,6 @@
 import base64
 from typing import Optional
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from appdevcommons.kms_encryptor import KMSEncryptor  # type: ignore[import-untyped]
 from app.dagger.aws_clients import AWSClients
@@ -40,6 +41,13 @@ class Settings(BaseSettings):
         "AQICAHg7rDJp72oZrIfl2vnBxkvlcidlgcJm7juguFV/iuWU+AGM3FYYNItUmrCB7TFQBDL/AAABCDCCAQQGCSqGSIb3DQEHBqCB9jCB8wIBADCB7QYJKoZIhvcNAQcBMB4GCWCGSAFlAwQBLjARBAzVeJ89eHcesGPCY78CARCAgb9r6mpx1Hgf6YtMrhInMGOJCzgvFfYUb2clYu1z2nwjPEqXHqQsysnTYQo9naCJRssK8bE8zaWxbYEtCFS06ylWQni1ZEZkWh2eOcLNqoyMMIpPMpa7Cn5k+/TxiTVeGfqBsTZc894vTqRqmlRBtbIDd7h/FJ1EZpf0rUzI6SPXQmh4yUw0l3PgiUD+HbS3jPaK8o68mJ/hBE+xeic+ax2sQC7Bilertwnof4CsBuQYcNWhkCDiZscnfhbrNyfM6g=="
     )
 
+    # Analysis output cache
+    analysis_cache_max_entries: int = Field(default=1024, ge=0)
+    analysis_cache_ttl_seconds: float = Field(default=300.0, gt=0)
+
+    # Workflow
+    workflow_max_concurrency: int = Field(default=16, gt=0)
+
     _aws_clients: Optional[AWSClients] = None
 
     model_config = SettingsConfigDict(
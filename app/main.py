@@ -3,13 +3,11 @@ import logging
 from fastapi import FastAPI
 from app.config import settings
 from app.routes import analysis, plan, workflow
+from app.services import openai_service, toggl_service
 from app.dagger.aws_clients import AWSClients
+from app.utils.logging_util import configure_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+configure_logging()
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +55,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Cleanup if needed
     logger.info("Shutting down application...")
+    await toggl_service.close_client()
+    await openai_service.close_client()
     # AWS clients don't need explicit cleanup, but we can log
     logger.info("Application shutdown complete")
 
@@ -72,10 +72,10 @@ app.include_router(workflow.router)
 
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Welcome to Daylytics Backend"}
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "healthy"}
@@ -1,8 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
-from typing import List, Any, Optional
+from typing import Annotated, List, Any, Optional
 from app.models.toggl import TogglTimeEntry
 
+# Upper bound on activity logs per request so oversized payloads fail fast with 422.
+MAX_ACTIVITY_LOGS = 100_000
+
 
 class ResponseMode(str, Enum):
     TEXT = "TEXT"
@@ -13,14 +16,18 @@ class ResponseMode(str, Enum):
 class CreateAnalysisRequest(BaseModel):
     prompt: str
     response_mode: ResponseMode
-    activity_logs: List[TogglTimeEntry]
+    activity_logs: Annotated[List[TogglTimeEntry], Field(max_length=MAX_ACTIVITY_LOGS)]
 
 
 class OutputConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     s3_output_path: str
 
 
 class CreateAnalysisResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     analysis_rid: str
     output_config: OutputConfig
     raw_output: Optional[Any] = None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List
 
 
@@ -10,6 +10,8 @@ class Step(BaseModel):
     description of what the step does, and reference to the next step.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     step_name: str
     step_description: str
     tool_name: str
@@ -24,6 +26,8 @@ class Workflow(BaseModel):
     to process a user's request.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     start: str  # the name of the first Step
     graph: List[Step]
 
@@ -37,4 +41,6 @@ class CreatePlanRequest(BaseModel):
 class CreatePlanResponse(BaseModel):
     """Response model for CreatePlan endpoint."""
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     workflow: Workflow
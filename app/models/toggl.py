@@ -1,5 +1,5 @@
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 from typing import List, Optional
 
@@ -24,3 +24,7 @@ class TogglTimeEntry(BaseModel):
     start: datetime
     stop: datetime
     duration: int  # seconds
+
+
+# Built once at import so list validation does not rebuild the schema per call.
+TOGGL_TIME_ENTRIES_ADAPTER = TypeAdapter(List[TogglTimeEntry])
@@ -1,53 +1,80 @@
 import logging
-from typing import Any
-
-from fastapi import APIRouter
-from appdevcommons.unique_id import UniqueIdGenerator  # type: ignore[import-untyped]
-from app.models.analysis import (
-    CreateAnalysisRequest,
-    CreateAnalysisResponse,
-    OutputConfig,
-    ResponseMode,
-)
-from app.agents.analyzers.metric_generator import generate_all_metrics
-from app.agents.analyzers.table_generator import generate_table
-from app.agents.analyzers.summarizer import generate_summary
+from typing import Any, Dict
+
+from fastapi import APIRouter, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from app.models.analysis import CreateAnalysisRequest, CreateAnalysisResponse
+from app.services import analysis_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
 
-@router.post("/", response_model=CreateAnalysisResponse)
-def create_analysis(request: CreateAnalysisRequest) -> CreateAnalysisResponse:  # type: ignore[no-redef]  # noqa: F811  # noqa: F811
-    logger.info(f"Creating analysis with mode: {request.response_mode}")
+def _build_request_body_schema() -> Dict[str, Any]:
+    """
+    Build a self-contained OpenAPI schema for CreateAnalysisRequest.
+
+    The route reads the raw body, so FastAPI cannot derive the request schema.
+    Nested models are inlined because "#/$defs/..." references do not resolve
+    inside an OpenAPI document.
+
+    Returns:
+        JSON schema dictionary with all references inlined
+    """
+    schema = CreateAnalysisRequest.model_json_schema()
+    definitions = schema.pop("$defs", {})
 
-    id_generator = UniqueIdGenerator()
-    analysis_rid = id_generator.generate_id()
+    def _inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return _inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: _inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [_inline(value) for value in node]
+        return node
 
-    raw_output: Any = None
+    return _inline(schema)
+
+
+@router.post(
+    "/",
+    response_model=CreateAnalysisResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": _build_request_body_schema()}},
+            "required": True,
+        }
+    },
+)
+async def create_analysis(request: Request) -> Response:
+    """
+    Create an analysis of the given activity logs.
 
-    if request.response_mode == ResponseMode.METRIC:
-        logger.info("Generating metrics from activity logs")
-        all_metrics = generate_all_metrics(request.prompt, request.activity_logs)
-        logger.info(f"Generated {len(all_metrics)} metrics")
-        raw_output = all_metrics
+    The body is parsed and validated in a single pass by pydantic-core instead
+    of FastAPI's json.loads + dict validation. The response is serialized once
+    and returned as a raw Response, so FastAPI skips re-validating it against
+    response_model, which is kept for the OpenAPI schema only.
 
-    elif request.response_mode == ResponseMode.TABLE:
-        logger.info("Generating table from activity logs")
-        table = generate_table(request.activity_logs)
-        logger.info(f"Generated table with {len(table)} rows")
-        raw_output = table
+    Args:
+        request: Incoming request whose body is a CreateAnalysisRequest
 
-    elif request.response_mode == ResponseMode.TEXT:
-        logger.info("Generating text summary from activity logs")
-        summary = generate_summary(request.activity_logs)
-        logger.info(f"Generated summary with {len(summary)} characters")
-        raw_output = summary
+    Returns:
+        JSON Response containing the serialized CreateAnalysisResponse
 
-    s3_output_path = f"s3://daylytics/analysis/{analysis_rid}/output"
+    Raises:
+        RequestValidationError: If the body is not a valid CreateAnalysisRequest
+    """
+    body = await request.body()
+    try:
+        analysis_request = CreateAnalysisRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        ) from e
 
-    return CreateAnalysisResponse(
-        analysis_rid=str(analysis_rid),  # type: ignore[arg-type]
-        output_config=OutputConfig(s3_output_path=s3_output_path),
-        raw_output=raw_output,
-    )
+    response = await analysis_service.create_analysis(analysis_request)
+    return Response(content=response.model_dump_json(), media_type="application/json")
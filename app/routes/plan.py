@@ -9,7 +9,7 @@ router = APIRouter(prefix="/plan", tags=["plan"])
 
 
 @router.post("/", response_model=CreatePlanResponse)
-def create_plan(request: CreatePlanRequest) -> CreatePlanResponse:
+async def create_plan(request: CreatePlanRequest) -> CreatePlanResponse:
     """
     Create a workflow plan for activity analysis.
 
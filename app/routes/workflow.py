@@ -1,28 +1,31 @@
+import asyncio
 import csv
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from typing import Dict, List, Set
+from datetime import date, datetime, timedelta
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from personal_prompt_temporary import get_personal_prompt_temporary
 from app.services.toggl_service import get_toggl_track_activity_logs
 from app.services.toggl_pdf_service import get_toggl_track_activity_logs_from_pdf
+from app.config import settings
 from app.models.analysis import (
     CreateAnalysisRequest,
     CreateAnalysisResponse,
     ResponseMode,
 )
 from app.models.toggl import TogglTimeEntry, InputConfig, ActivityLogSource
-from app.routes.analysis import create_analysis
-from app.utils.general_util import get_next_date
+from app.services.analysis_service import create_analysis
+from app.utils.general_util import SEATTLE_TZ, as_utc_if_naive
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/workflow", tags=["workflow"])
 
+# Tags that mark an activity log as bed time
+BED_TIME_TAGS = frozenset({"bed_time", "sleep"})
+
 # Fixed column order (metric titles as they appear from the API)
 CSV_COLUMN_ORDER = [
     "WakeUpTimePerDay",
@@ -41,142 +44,98 @@ CSV_COLUMN_ORDER = [
 ]
 
 
-def _write_metrics_to_csv(
-    csv_path: Path, analysis_responses: List[CreateAnalysisResponse]
+def _merge_metrics_into_rows(
+    analysis_response: CreateAnalysisResponse,
+    rows_by_date: Dict[date, Dict[str, str]],
+    all_column_names: Set[str],
 ) -> None:
     """
-    Write all metrics from analysis responses to CSV file.
-
-    Builds data structure in memory and writes CSV file once.
+    Merge the metrics of one analysis response into the in-memory CSV rows.
 
     Args:
-        csv_path: Path to the CSV file
-        analysis_responses: List of CreateAnalysisResponse objects
+        analysis_response: CreateAnalysisResponse whose metrics to merge
+        rows_by_date: CSV rows keyed by metric date, updated in place
+        all_column_names: Column names seen so far, updated in place
     """
-    rows_by_date: Dict[str, Dict[str, str]] = {}
-    all_column_names: set = {"Day"}
+    if analysis_response.raw_output is None:
+        return
+    for metric in analysis_response.raw_output:
+        # Get or create row for this date, formatting the date as MM/DD/YYYY once
+        row = rows_by_date.get(metric.date)
+        if row is None:
+            row = {"Day": metric.date.strftime("%m/%d/%Y")}
+            rows_by_date[metric.date] = row
 
-    # Build data structure in memory
-    for analysis_response in analysis_responses:
-        if analysis_response.raw_output is None:
-            continue
-        metrics = analysis_response.raw_output
-        for metric in metrics:
-            # Format date as MM/DD/YYYY
-            date_str = metric.date.strftime("%m/%d/%Y")
+        # Use metric title directly as column name
+        column_name = metric.title
+        all_column_names.add(column_name)
 
-            # Get or create row for this date
-            if date_str not in rows_by_date:
-                rows_by_date[date_str] = {"Day": date_str}
+        # Set the metric value (always in minutes)
+        row[column_name] = str(metric.value)
 
-            # Use metric title directly as column name
-            column_name = metric.title
-            all_column_names.add(column_name)
 
-            # Set the metric value (always in minutes)
-            rows_by_date[date_str][column_name] = str(metric.value)
+def _write_metrics_to_csv(
+    csv_path: Path,
+    rows_by_date: Dict[date, Dict[str, str]],
+    all_column_names: Set[str],
+) -> None:
+    """
+    Write the merged metric rows to CSV file, one row per date in date order.
 
+    Args:
+        csv_path: Path to the CSV file
+        rows_by_date: CSV rows keyed by metric date
+        all_column_names: Every column name present in the rows
+    """
     # Build final column order: Day first, then CSV_COLUMN_ORDER (excluding Day), then any others
     final_columns = ["Day"]
+    placed_columns = {"Day"}
     for col in CSV_COLUMN_ORDER:
-        if col != "Day" and col in all_column_names:
+        if col in all_column_names and col not in placed_columns:
             final_columns.append(col)
+            placed_columns.add(col)
 
     # Add any remaining columns not in CSV_COLUMN_ORDER
-    for col in sorted(all_column_names):
-        if col not in final_columns:
-            final_columns.append(col)
-
-    # Ensure all rows have all columns
-    for row in rows_by_date.values():
-        for col in final_columns:
-            if col not in row:
-                row[col] = ""
+    final_columns.extend(sorted(all_column_names - placed_columns))
 
-    # Write CSV file once with fixed column order
+    # Write CSV file once with fixed column order; missing metrics are left blank
     with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=final_columns)
-        writer.writeheader()
-        for date_key in rows_by_date.keys():
-            writer.writerow(rows_by_date[date_key])
+        writer = csv.writer(f)
+        writer.writerow(final_columns)
+        writer.writerows(
+            [rows_by_date[day].get(col, "") for col in final_columns]
+            for day in sorted(rows_by_date)
+        )
 
     logger.info(
         f"Wrote {len(rows_by_date)} rows with {len(final_columns)} columns to CSV"
     )
 
 
-def _filter_activity_log_with_bed_time_tag(
+def _bucket_activity_logs_by_start_date(
     activity_logs: List[TogglTimeEntry],
-) -> List[TogglTimeEntry]:
-    """
-    Filter activity logs that have "bed_time" or "sleep" tags.
-
-    Args:
-        activity_logs: List of TogglTimeEntry objects
-
-    Returns:
-        List of TogglTimeEntry objects with bed_time or sleep tags
+) -> Dict[date, List[TogglTimeEntry]]:
     """
-    filtered_logs = []
-    for log in activity_logs:
-        has_bed_time_tag = "bed_time" in log.tags
-        has_sleep_tag = "sleep" in log.tags
-        if has_bed_time_tag or has_sleep_tag:
-            filtered_logs.append(log)
-    return filtered_logs
-
+    Group activity logs by the Seattle date on which they started.
 
-def _filter_activity_log_started_between_00_00_12_00(
-    activity_logs: List[TogglTimeEntry], next_date: str
-) -> List[TogglTimeEntry]:
-    """
-    Filter bed_time or sleep activity logs that occurred between 00:00 and 12:00 (noon) of next_date.
+    Built once per workflow so per-date lookups only touch the logs of the
+    neighbouring days instead of rescanning every log for every date.
 
     Args:
-        activity_logs: List of TogglTimeEntry objects (should already be filtered to only include bed_time or sleep logs)
-        next_date: Next date as ISO-8601 datetime string (e.g., 2026-01-01T00:00:00-08:00)
+        activity_logs: List of all pre-fetched TogglTimeEntry objects
 
     Returns:
-        List of filtered TogglTimeEntry objects with bed_time or sleep tags that start between 00:00-12:00 of next_date
+        Mapping of Seattle start date to the logs that started on it, in input order
     """
-    filtered_logs = []
-    seattle_tz = ZoneInfo("America/Los_Angeles")
-    utc_tz = ZoneInfo("UTC")
-
-    next_date_normalized = next_date.replace("Z", "+00:00")
-    next_date_parsed = datetime.fromisoformat(next_date_normalized)
-    if next_date_parsed.tzinfo is None:
-        next_date_utc = next_date_parsed.replace(tzinfo=utc_tz)
-    else:
-        next_date_utc = next_date_parsed.astimezone(utc_tz)
-    next_date_seattle = next_date_utc.astimezone(seattle_tz)
-    next_date_str = next_date_seattle.strftime("%Y-%m-%d")
-
-    next_date_start = next_date_seattle.replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    next_date_noon = next_date_seattle.replace(
-        hour=12, minute=0, second=0, microsecond=0
-    )
-
+    logs_by_start_date: Dict[date, List[TogglTimeEntry]] = {}
     for log in activity_logs:
-        log_start_utc = log.start
-        if log_start_utc.tzinfo is None:
-            log_start_utc = log_start_utc.replace(tzinfo=utc_tz)
-        else:
-            log_start_utc = log_start_utc.astimezone(utc_tz)
-        log_start_seattle = log_start_utc.astimezone(seattle_tz)
-        log_start_date_str = log_start_seattle.strftime("%Y-%m-%d")
-
-        if log_start_date_str == next_date_str:
-            if next_date_start <= log_start_seattle < next_date_noon:
-                filtered_logs.append(log)
-
-    return filtered_logs
+        start_date = as_utc_if_naive(log.start).astimezone(SEATTLE_TZ).date()
+        logs_by_start_date.setdefault(start_date, []).append(log)
+    return logs_by_start_date
 
 
 def _get_bed_time_logs_for_next_date(
-    activity_logs: List[TogglTimeEntry], next_date: str
+    logs_by_start_date: Dict[date, List[TogglTimeEntry]], next_day: date
 ) -> List[TogglTimeEntry]:
     """
     Get bed_time activity logs from pre-fetched data for a specific next date (00:00-12:00).
@@ -186,21 +145,22 @@ def _get_bed_time_logs_for_next_date(
     2. Started between 00:00 and 12:00 (noon) of the next date
 
     Args:
-        activity_logs: List of all pre-fetched TogglTimeEntry objects
-        next_date: The next date as ISO-8601 datetime string
+        logs_by_start_date: Pre-fetched logs grouped by Seattle start date
+        next_day: The next date in Seattle time
 
     Returns:
         List of TogglTimeEntry objects with bed_time/sleep tags from next date (00:00-12:00)
     """
-    bed_time_logs = _filter_activity_log_with_bed_time_tag(activity_logs)
-    filtered_logs = _filter_activity_log_started_between_00_00_12_00(
-        bed_time_logs, next_date
-    )
-    return filtered_logs
+    return [
+        log
+        for log in logs_by_start_date.get(next_day, [])
+        if not BED_TIME_TAGS.isdisjoint(log.tags)
+        and as_utc_if_naive(log.start).astimezone(SEATTLE_TZ).hour < 12
+    ]
 
 
 def _filter_activity_logs_for_date(
-    activity_logs: List[TogglTimeEntry], target_date: str
+    logs_by_start_date: Dict[date, List[TogglTimeEntry]], target_day: date
 ) -> List[TogglTimeEntry]:
     """
     Filter activity logs that belong to a specific date.
@@ -210,80 +170,54 @@ def _filter_activity_logs_for_date(
     2. It started on the previous date and ended on the target date
 
     Args:
-        activity_logs: List of TogglTimeEntry objects
-        target_date: Target date as ISO-8601 datetime string
+        logs_by_start_date: Pre-fetched logs grouped by Seattle start date
+        target_day: Target date in Seattle time
 
     Returns:
-        List of TogglTimeEntry objects that belong to the target date
+        List of TogglTimeEntry objects that belong to the target date, with the
+        overnight logs from the previous date first
     """
-    filtered_logs = []
-    seattle_tz = ZoneInfo("America/Los_Angeles")
-    utc_tz = ZoneInfo("UTC")
-
-    # Parse target date and get date string in Seattle timezone
-    target_date_normalized = target_date.replace("Z", "+00:00")
-    target_dt = datetime.fromisoformat(target_date_normalized)
-    if target_dt.tzinfo is None:
-        target_dt = target_dt.replace(tzinfo=utc_tz)
-    target_dt_seattle = target_dt.astimezone(seattle_tz)
-    target_date_str = target_dt_seattle.strftime("%Y-%m-%d")
-
-    # Calculate previous date string
-    prev_dt_seattle = target_dt_seattle - timedelta(days=1)
-    prev_date_str = prev_dt_seattle.strftime("%Y-%m-%d")
+    previous_day = target_day - timedelta(days=1)
 
-    for log in activity_logs:
-        # Get log start date in Seattle timezone
-        log_start_utc = log.start
-        if log_start_utc.tzinfo is None:
-            log_start_utc = log_start_utc.replace(tzinfo=utc_tz)
-        else:
-            log_start_utc = log_start_utc.astimezone(utc_tz)
-        log_start_seattle = log_start_utc.astimezone(seattle_tz)
-        log_start_date_str = log_start_seattle.strftime("%Y-%m-%d")
-
-        # Case 1: Log started on target date
-        if log_start_date_str == target_date_str:
-            filtered_logs.append(log)
-            continue
-
-        # Case 2: Log started on previous date and ended on target date
-        if log_start_date_str == prev_date_str and log.stop is not None:
-            log_end_utc = log.stop
-            if log_end_utc.tzinfo is None:
-                log_end_utc = log_end_utc.replace(tzinfo=utc_tz)
-            else:
-                log_end_utc = log_end_utc.astimezone(utc_tz)
-            log_end_seattle = log_end_utc.astimezone(seattle_tz)
-            log_end_date_str = log_end_seattle.strftime("%Y-%m-%d")
-
-            if log_end_date_str == target_date_str:
-                filtered_logs.append(log)
-
-    return filtered_logs
-
-
-def _get_dates_in_range(start_date: str, end_date: str) -> List[str]:
+    overnight_logs = [
+        log
+        for log in logs_by_start_date.get(previous_day, [])
+        if log.stop is not None
+        and as_utc_if_naive(log.stop).astimezone(SEATTLE_TZ).date() == target_day
+    ]
+    return overnight_logs + logs_by_start_date.get(target_day, [])
+
+
+def _to_seattle_date(value: datetime) -> date:
     """
-    Generate a list of dates from start_date to end_date (inclusive).
+    Get the Seattle calendar date of a datetime.
 
     Args:
-        start_date: Start date as ISO-8601 datetime string
-        end_date: End date as ISO-8601 datetime string
+        value: Naive or timezone-aware datetime (naive values are treated as UTC)
 
     Returns:
-        List of ISO-8601 datetime strings for each day in the range
+        The calendar date in Seattle time
+    """
+    return as_utc_if_naive(value).astimezone(SEATTLE_TZ).date()
+
+
+def _get_dates_in_range(start_dt: datetime, end_dt: datetime) -> List[datetime]:
+    """
+    Generate a list of dates from start_dt to end_dt (inclusive).
+
+    Args:
+        start_dt: Parsed start datetime
+        end_dt: Parsed end datetime
+
+    Returns:
+        List of datetimes one day apart, starting at start_dt
     """
     dates = []
-    current_date = start_date
-    end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+    current_dt = start_dt
 
-    while True:
-        current_dt = datetime.fromisoformat(current_date.replace("Z", "+00:00"))
-        if current_dt > end_dt:
-            break
-        dates.append(current_date)
-        current_date = get_next_date(current_date)
+    while current_dt <= end_dt:
+        dates.append(current_dt)
+        current_dt += timedelta(days=1)
 
     return dates
 
@@ -309,7 +243,7 @@ class StartWorkflowResponse(BaseModel):
 # In that world, the MCP client (e.g. Claude CLI or Kiro CLI) will be
 # the orchestrator of the workflow.
 @router.post("/", response_model=StartWorkflowResponse)
-def start_workflow(request: StartWorkflowRequest) -> StartWorkflowResponse:
+async def start_workflow(request: StartWorkflowRequest) -> StartWorkflowResponse:
     """
     Start workflow to retrieve activity logs and create analysis.
 
@@ -326,8 +260,8 @@ def start_workflow(request: StartWorkflowRequest) -> StartWorkflowResponse:
     logger.info(f"Starting workflow from {request.start_date} to {request.end_date}")
 
     # Validate date range (max 5 days)
-    start_dt = datetime.fromisoformat(request.start_date.replace("Z", "+00:00"))
-    end_dt = datetime.fromisoformat(request.end_date.replace("Z", "+00:00"))
+    start_dt = datetime.fromisoformat(request.start_date)
+    end_dt = datetime.fromisoformat(request.end_date)
     date_diff = (end_dt - start_dt).days
     if date_diff > 20:
         raise HTTPException(
@@ -339,7 +273,7 @@ def start_workflow(request: StartWorkflowRequest) -> StartWorkflowResponse:
     # Services internally handle start_date - 1 (for overnight entries)
     # Caller passes end_date + 1 (for bed_time logs from day after end_date)
     logger.info("Step 1: Retrieving activity logs...")
-    end_date_plus_one = get_next_date(request.end_date)
+    end_date_plus_one = (end_dt + timedelta(days=1)).isoformat()
 
     if request.input_config.mode == ActivityLogSource.TOGGL_PDF:
         if not request.input_config.local_paths:
@@ -348,37 +282,47 @@ def start_workflow(request: StartWorkflowRequest) -> StartWorkflowResponse:
                 detail="local_paths is required when mode is TOGGL_PDF",
             )
         # PDF mode: extract entries from PDF files
-        logger.info(f"Using PDF mode with {len(request.input_config.local_paths)} files")
-        all_activity_logs = get_toggl_track_activity_logs_from_pdf(
-            request.input_config.local_paths, request.start_date, end_date_plus_one
+        logger.info(
+            f"Using PDF mode with {len(request.input_config.local_paths)} files"
+        )
+        all_activity_logs = await asyncio.to_thread(
+            get_toggl_track_activity_logs_from_pdf,
+            request.input_config.local_paths,
+            request.start_date,
+            end_date_plus_one,
         )
     else:
         # API mode: retrieve from Toggl Track API
         logger.info("Using API mode to retrieve activity logs from Toggl Track...")
-        all_activity_logs = get_toggl_track_activity_logs(
+        all_activity_logs = await get_toggl_track_activity_logs(
             request.start_date, end_date_plus_one
         )
     logger.info(f"Retrieved {len(all_activity_logs)} activity logs")
 
     # Step 2: Build all analysis requests for all dates
-    dates_in_range = _get_dates_in_range(request.start_date, request.end_date)
+    dates_in_range = _get_dates_in_range(start_dt, end_dt)
     logger.info(f"Step 2: Building requests for {len(dates_in_range)} dates...")
     all_analysis_requests = []
+    logs_by_start_date = _bucket_activity_logs_by_start_date(all_activity_logs)
 
-    for date_idx, current_date in enumerate(dates_in_range, 1):
+    for date_idx, current_dt in enumerate(dates_in_range, 1):
+        # The first date reaches the prompts exactly as requested
+        current_date = request.start_date if date_idx == 1 else current_dt.isoformat()
         logger.info(
             f"Building requests for date {date_idx}/{len(dates_in_range)}: {current_date}"
         )
 
         # Filter activity logs for this date
+        current_day = _to_seattle_date(current_dt)
         date_activity_logs = _filter_activity_logs_for_date(
-            all_activity_logs, current_date
+            logs_by_start_date, current_day
         )
         logger.info(f"  Found {len(date_activity_logs)} activity logs for this date")
 
         # Get bed_time logs from next date (00:00-12:00)
-        next_date = get_next_date(current_date)
-        bed_time_logs = _get_bed_time_logs_for_next_date(all_activity_logs, next_date)
+        bed_time_logs = _get_bed_time_logs_for_next_date(
+            logs_by_start_date, current_day + timedelta(days=1)
+        )
         logger.info(f"  Found {len(bed_time_logs)} bed_time logs from next date")
 
         # Combine activity logs with bed_time logs
@@ -401,26 +345,42 @@ def start_workflow(request: StartWorkflowRequest) -> StartWorkflowResponse:
     logger.info(
         f"Step 3: Executing {len(all_analysis_requests)} analysis requests in parallel..."
     )
-    with ThreadPoolExecutor(max_workers=len(all_analysis_requests)) as executor:
-        analysis_responses = list(executor.map(create_analysis, all_analysis_requests))
-    logger.info(f"Completed {len(analysis_responses)} analyses")
+    semaphore = asyncio.Semaphore(settings.workflow_max_concurrency)
+
+    async def _run_analysis(
+        analysis_request: CreateAnalysisRequest,
+    ) -> CreateAnalysisResponse:
+        async with semaphore:
+            return await create_analysis(analysis_request)
+
+    # Merge each response into the CSV rows as soon as it completes
+    rows_by_date: Dict[date, Dict[str, str]] = {}
+    all_column_names: Set[str] = {"Day"}
+    analysis_tasks = [
+        asyncio.create_task(_run_analysis(analysis_request))
+        for analysis_request in all_analysis_requests
+    ]
+    try:
+        for analysis_future in asyncio.as_completed(analysis_tasks):
+            _merge_metrics_into_rows(
+                await analysis_future, rows_by_date, all_column_names
+            )
+    finally:
+        # On failure, stop the remaining analyses instead of leaving them running
+        for analysis_task in analysis_tasks:
+            analysis_task.cancel()
+        await asyncio.gather(*analysis_tasks, return_exceptions=True)
+    logger.info(f"Completed {len(all_analysis_requests)} analyses")
 
     # Step 4: Write all metrics to CSV file
     desktop_path = Path.home() / "Desktop"
-    # Extract date part from ISO-8601 datetime strings
-    start_date_part = (
-        request.start_date.split("T")[0]
-        if "T" in request.start_date
-        else request.start_date
-    )
-    end_date_part = (
-        request.end_date.split("T")[0] if "T" in request.end_date else request.end_date
-    )
+    start_date_part = start_dt.date().isoformat()
+    end_date_part = end_dt.date().isoformat()
     csv_filename = f"AnalysisOutput{start_date_part}{end_date_part}.csv"
     csv_path = desktop_path / csv_filename
 
     logger.info(f"Writing all metrics to CSV file at {csv_path}")
-    _write_metrics_to_csv(csv_path, analysis_responses)
+    _write_metrics_to_csv(csv_path, rows_by_date, all_column_names)
     logger.info(f"Completed workflow. CSV file saved at {csv_path}")
 
     # Return any dummy value.
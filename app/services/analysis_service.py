@@ -0,0 +1,145 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from appdevcommons.unique_id import UniqueIdGenerator  # type: ignore[import-untyped]
+from app.config import settings
+from app.models.analysis import (
+    CreateAnalysisRequest,
+    CreateAnalysisResponse,
+    OutputConfig,
+    ResponseMode,
+)
+from app.agents.analyzers.metric_generator import generate_all_metrics
+from app.agents.analyzers.table_generator import generate_table
+from app.agents.analyzers.summarizer import generate_summary
+
+logger = logging.getLogger(__name__)
+
+_S3_OUTPUT_PATH_TEMPLATE = "s3://daylytics/analysis/{}/output"
+
+# Maps request hash -> (expiry on the monotonic clock, raw output), oldest first.
+# Only touched from the event loop thread, so no lock is needed.
+_raw_output_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_MISSING = object()
+
+
+async def create_analysis(request: CreateAnalysisRequest) -> CreateAnalysisResponse:
+    """
+    Create an analysis of activity logs using the requested analyzer agent.
+
+    Raw output for identical requests (same prompt, response mode and activity
+    logs) is served from an in-memory TTL cache, while every analysis still
+    gets its own RID.
+
+    Args:
+        request: CreateAnalysisRequest containing prompt, response mode and activity logs
+
+    Returns:
+        CreateAnalysisResponse containing the analysis RID, output config and raw output
+    """
+    logger.info(f"Creating analysis with mode: {request.response_mode}")
+
+    analysis_rid = UniqueIdGenerator.generate_id()
+
+    cache_key = _build_cache_key(request)
+    raw_output = _get_cached_raw_output(cache_key)
+    if raw_output is _MISSING:
+        raw_output = await _RAW_OUTPUT_GENERATORS[request.response_mode](request)
+        _cache_raw_output(cache_key, raw_output)
+    else:
+        logger.info("Serving analysis output from cache")
+
+    s3_output_path = _S3_OUTPUT_PATH_TEMPLATE.format(analysis_rid)
+
+    # Values are generated server-side, so skip Pydantic validation.
+    return CreateAnalysisResponse.model_construct(
+        analysis_rid=str(analysis_rid),
+        output_config=OutputConfig.model_construct(s3_output_path=s3_output_path),
+        raw_output=raw_output,
+    )
+
+
+async def _generate_metric_output(request: CreateAnalysisRequest) -> Any:
+    """Generate metrics from the request's activity logs."""
+    logger.info("Generating metrics from activity logs")
+    all_metrics = await generate_all_metrics(request.prompt, request.activity_logs)
+    logger.info(f"Generated {len(all_metrics)} metrics")
+    return all_metrics
+
+
+async def _generate_table_output(request: CreateAnalysisRequest) -> Any:
+    """Generate a table from the request's activity logs."""
+    logger.info("Generating table from activity logs")
+    table = generate_table(request.activity_logs)
+    logger.info(f"Generated table with {len(table)} rows")
+    return table
+
+
+async def _generate_text_output(request: CreateAnalysisRequest) -> Any:
+    """Generate a text summary from the request's activity logs."""
+    logger.info("Generating text summary from activity logs")
+    summary = generate_summary(request.activity_logs)
+    logger.info(f"Generated summary with {len(summary)} characters")
+    return summary
+
+
+_RAW_OUTPUT_GENERATORS: Dict[
+    ResponseMode, Callable[[CreateAnalysisRequest], Awaitable[Any]]
+] = {
+    ResponseMode.METRIC: _generate_metric_output,
+    ResponseMode.TABLE: _generate_table_output,
+    ResponseMode.TEXT: _generate_text_output,
+}
+
+
+def _build_cache_key(request: CreateAnalysisRequest) -> str:
+    """
+    Build a stable cache key from the full request payload.
+
+    Args:
+        request: CreateAnalysisRequest to key
+
+    Returns:
+        Hex digest of the serialized request
+    """
+    payload = request.model_dump_json().encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _get_cached_raw_output(cache_key: str) -> Any:
+    """
+    Look up cached raw output, evicting it if expired.
+
+    Args:
+        cache_key: Key built by _build_cache_key
+
+    Returns:
+        Cached raw output, or _MISSING if absent or expired
+    """
+    cached = _raw_output_cache.get(cache_key)
+    if cached is None:
+        return _MISSING
+    expires_at, raw_output = cached
+    if expires_at <= time.monotonic():
+        del _raw_output_cache[cache_key]
+        return _MISSING
+    _raw_output_cache.move_to_end(cache_key)
+    return raw_output
+
+
+def _cache_raw_output(cache_key: str, raw_output: Any) -> None:
+    """
+    Store raw output, evicting least recently used entries beyond the size limit.
+
+    Args:
+        cache_key: Key built by _build_cache_key
+        raw_output: Analyzer output to cache
+    """
+    expires_at = time.monotonic() + settings.analysis_cache_ttl_seconds
+    _raw_output_cache[cache_key] = (expires_at, raw_output)
+    _raw_output_cache.move_to_end(cache_key)
+    while len(_raw_output_cache) > settings.analysis_cache_max_entries:
+        _raw_output_cache.popitem(last=False)
@@ -1,20 +1,23 @@
 from base64 import b64encode
+from functools import lru_cache
 from typing import Dict, Any, List
 import logging
 from datetime import datetime
-from zoneinfo import ZoneInfo
 from app.config import settings
-from app.models.toggl import TogglTimeEntry
+from app.models.toggl import TogglTimeEntry, TOGGL_TIME_ENTRIES_ADAPTER
+from app.utils.general_util import SEATTLE_TZ, as_utc_if_naive
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_toggl_cred() -> str:
     """
     Get base64 encoded API token credentials from config file.
 
     Retrieves API token from settings and encodes it in base64
     format for Basic authentication using Toggl API token format.
+    The result is cached, so the token is decrypted only once per process.
 
     Returns:
         Base64 encoded string of "api_token:api_token"
@@ -65,60 +68,41 @@ def _validate_raw_time_entry(time_entry: Dict[str, Any]) -> None:
         )
 
 
-def _deserialize_time_entry(time_entry: Dict[str, Any]) -> TogglTimeEntry:
+def _convert_time_entry_to_seattle_tz(time_entry: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Deserialize a single time entry dictionary into a TogglTimeEntry object.
+    Validate a raw time entry and convert its timestamps to Seattle time.
 
-    Converts a raw time entry dictionary from Toggl API into a validated
-    TogglTimeEntry Pydantic model. UTC timestamps from Toggl API are converted
-    to Seattle time (America/Los_Angeles timezone). Unsupported fields are ignored.
+    UTC timestamps from Toggl API are converted to Seattle time
+    (America/Los_Angeles timezone). Unsupported fields are left in place and
+    ignored during model validation.
 
     Args:
         time_entry: Raw time entry dictionary from Toggl API
 
     Returns:
-        TogglTimeEntry object with start and stop times in Seattle timezone
+        Time entry dictionary with start and stop times in Seattle timezone
 
     Raises:
         ValueError: If required fields are missing
     """
     _validate_raw_time_entry(time_entry)
 
-    seattle_tz = ZoneInfo("America/Los_Angeles")
-    utc_tz = ZoneInfo("UTC")
-
     start_str = str(time_entry["start"])
     stop_str = str(time_entry["stop"])
 
-    start_normalized = start_str.replace("Z", "+00:00")
-    start_parsed = datetime.fromisoformat(start_normalized)
-    if start_parsed.tzinfo is None:
-        start_utc = start_parsed.replace(tzinfo=utc_tz)
-    else:
-        start_utc = start_parsed.astimezone(utc_tz)
-
-    stop_normalized = stop_str.replace("Z", "+00:00")
-    stop_parsed = datetime.fromisoformat(stop_normalized)
-    if stop_parsed.tzinfo is None:
-        stop_utc = stop_parsed.replace(tzinfo=utc_tz)
-    else:
-        stop_utc = stop_parsed.astimezone(utc_tz)
-
-    start_seattle = start_utc.astimezone(seattle_tz)
-    stop_seattle = stop_utc.astimezone(seattle_tz)
+    start_seattle = as_utc_if_naive(datetime.fromisoformat(start_str)).astimezone(
+        SEATTLE_TZ
+    )
+    stop_seattle = as_utc_if_naive(datetime.fromisoformat(stop_str)).astimezone(
+        SEATTLE_TZ
+    )
 
-    time_entry_with_seattle_tz = {
+    return {
         **time_entry,
         "start": start_seattle,
         "stop": stop_seattle,
     }
 
-    toggl_entry = TogglTimeEntry.model_validate(time_entry_with_seattle_tz)
-    logger.debug(
-        f"Successfully deserialized time entry {time_entry.get('id', 'unknown')} into TogglTimeEntry with Seattle timezone"
-    )
-    return toggl_entry
-
 
 def deserialize_time_entries(
     time_entries: List[Dict[str, Any]]
@@ -126,21 +110,25 @@ def deserialize_time_entries(
     """
     Deserialize an array of time entry dictionaries into TogglTimeEntry objects.
 
-    Iterates through time entries and converts each raw time entry dictionary
-    from Toggl API into validated TogglTimeEntry Pydantic models.
+    Converts each raw time entry dictionary from Toggl API to Seattle time,
+    then validates the whole list into TogglTimeEntry Pydantic models in a
+    single pydantic-core call.
 
     Args:
         time_entries: List of raw time entry dictionaries from Toggl API
 
     Returns:
         List of TogglTimeEntry objects
+
+    Raises:
+        ValueError: If required fields are missing
     """
     logger.info(f"Deserializing {len(time_entries)} time entries")
 
-    deserialized_entries = []
-    for entry in time_entries:
-        deserialized_entry = _deserialize_time_entry(entry)
-        deserialized_entries.append(deserialized_entry)
+    converted_entries = [
+        _convert_time_entry_to_seattle_tz(entry) for entry in time_entries
+    ]
+    deserialized_entries = TOGGL_TIME_ENTRIES_ADAPTER.validate_python(converted_entries)
 
     logger.info(f"Successfully deserialized {len(deserialized_entries)} time entries")
     return deserialized_entries
@@ -1,31 +1,85 @@
+import asyncio
 import logging
 import random
-import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from app.config import settings
 
-from openai import OpenAI, RateLimitError  # type: ignore[import-untyped]
+from openai import AsyncOpenAI, RateLimitError  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
 # Retry configuration
 MAX_RETRIES = 3
 BASE_DELAY_SECONDS = 1.0
+# Upper bound on a server-suggested Retry-After wait
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+# Shared client so OpenAI requests reuse pooled connections; closed on shutdown.
+_client: Optional[AsyncOpenAI] = None
 
 
 def get_openai_cred() -> str:
     return settings.openai_api_key
 
 
-def responses(
+def _get_client() -> AsyncOpenAI:
+    """
+    Get the process-wide async OpenAI client, creating it on first use.
+
+    Shared so its connection pool is reused by every call, and the API key is
+    decrypted only once.
+
+    Returns:
+        AsyncOpenAI client authenticated with the configured API key
+    """
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(api_key=get_openai_cred())
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared OpenAI client, if it was created."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+def _get_retry_after_seconds(error: RateLimitError) -> Optional[float]:
+    """
+    Read the server-suggested backoff from a rate limit error, if any.
+
+    Args:
+        error: RateLimitError raised by the OpenAI client
+
+    Returns:
+        Seconds to wait from the retry-after-ms or retry-after header, capped at
+        MAX_RETRY_AFTER_SECONDS, or None if neither is present as a number
+    """
+    headers = error.response.headers
+    for header, scale in (("retry-after-ms", 1000.0), ("retry-after", 1.0)):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            delay = float(value) / scale
+        except ValueError:
+            continue
+        return min(max(0.0, delay), MAX_RETRY_AFTER_SECONDS)
+    return None
+
+
+async def responses(
     model: str,
     input_text: str,
 ) -> Dict[str, Any]:
     """
     Call OpenAI Responses API with retry on rate limit errors.
 
-    Uses exponential backoff with jitter for retries.
+    Waits without blocking the event loop between retries, honouring the
+    API's Retry-After hint and falling back to exponential backoff with jitter.
 
     Args:
         model: Model to use (e.g., "gpt-4.1-mini")
@@ -37,8 +91,7 @@ def responses(
     Raises:
         RateLimitError: If rate limit is hit after all retries exhausted
     """
-    api_key = get_openai_cred()
-    client = OpenAI(api_key=api_key)
+    client = _get_client()
 
     last_exception = None
     for attempt in range(MAX_RETRIES + 1):
@@ -46,7 +99,7 @@ def responses(
             logger.info(
                 f"Calling OpenAI Responses API with model: {model} (attempt {attempt + 1})"
             )
-            response = client.responses.create(
+            response = await client.responses.create(
                 model=model,
                 input=input_text,
             )
@@ -56,12 +109,14 @@ def responses(
         except RateLimitError as e:
             last_exception = e
             if attempt < MAX_RETRIES:
-                # Exponential backoff with jitter
-                delay = BASE_DELAY_SECONDS * (2**attempt) + random.uniform(0, 1)
+                delay = _get_retry_after_seconds(e)
+                if delay is None:
+                    # Exponential backoff with jitter
+                    delay = BASE_DELAY_SECONDS * (2**attempt) + random.uniform(0, 1)
                 logger.warning(
                     f"Rate limit hit, retrying in {delay:.2f}s (attempt {attempt + 1}/{MAX_RETRIES + 1})"
                 )
-                time.sleep(delay)
+                await asyncio.sleep(delay)
             else:
                 logger.error(
                     f"Rate limit hit, all {MAX_RETRIES + 1} attempts exhausted"
@@ -1,17 +1,41 @@
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Optional
 import logging
 import httpx
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta
 from app.models.toggl import TogglTimeEntry
 from app.services.helpers.toggl_service_helper import (
     get_toggl_cred,
     deserialize_time_entries,
 )
-from app.utils.general_util import get_previous_date
+from app.utils.general_util import SEATTLE_TZ, as_utc_if_naive, get_previous_date
 
 logger = logging.getLogger(__name__)
 
+# Shared client so Toggl requests reuse pooled connections; closed on shutdown.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide Toggl HTTP client, creating it on first use.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient()
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Toggl HTTP client, if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def _filter_entries_ending_on_date(
     time_entries: List[Dict[str, Any]], target_date: str
@@ -26,33 +50,22 @@ def _filter_entries_ending_on_date(
     Returns:
         List of filtered time entry dictionaries that end on target_date
     """
-    filtered_entries = []
-    seattle_tz = ZoneInfo("America/Los_Angeles")
-    utc_tz = ZoneInfo("UTC")
-
-    target_date_normalized = target_date.replace("Z", "+00:00")
-    target_date_parsed = datetime.fromisoformat(target_date_normalized)
-    if target_date_parsed.tzinfo is None:
-        target_utc = target_date_parsed.replace(tzinfo=utc_tz)
-    else:
-        target_utc = target_date_parsed.astimezone(utc_tz)
-    target_seattle = target_utc.astimezone(seattle_tz)
-    target_date_str = target_seattle.strftime("%Y-%m-%d")
+    target_date_parsed = as_utc_if_naive(datetime.fromisoformat(target_date))
+
+    # Seattle day bounds as POSIX timestamps, computed once
+    day_start = target_date_parsed.astimezone(SEATTLE_TZ).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    day_start_ts = day_start.timestamp()
+    day_end_ts = (day_start + timedelta(days=1)).timestamp()
 
+    filtered_entries = []
     for entry in time_entries:
         stop_str = str(entry.get("stop", ""))
         if stop_str:
-            stop_normalized = stop_str.replace("Z", "+00:00")
             try:
-                stop_parsed = datetime.fromisoformat(stop_normalized)
-                if stop_parsed.tzinfo is None:
-                    stop_utc = stop_parsed.replace(tzinfo=utc_tz)
-                else:
-                    stop_utc = stop_parsed.astimezone(utc_tz)
-
-                stop_seattle = stop_utc.astimezone(seattle_tz)
-                stop_date_str = stop_seattle.strftime("%Y-%m-%d")
-                if stop_date_str == target_date_str:
+                stop_parsed = as_utc_if_naive(datetime.fromisoformat(stop_str))
+                if day_start_ts <= stop_parsed.timestamp() < day_end_ts:
                     filtered_entries.append(entry)
             except (ValueError, AttributeError) as e:
                 logger.warning(
@@ -62,7 +75,7 @@ def _filter_entries_ending_on_date(
     return filtered_entries
 
 
-def _get_time_entries(start_date: str, end_date: str) -> List[Dict[str, Any]]:
+async def _get_time_entries(start_date: str, end_date: str) -> List[Dict[str, Any]]:
     """
     Retrieve time entries from Toggl Track API for a date range using API token.
 
@@ -92,15 +105,14 @@ def _get_time_entries(start_date: str, end_date: str) -> List[Dict[str, Any]]:
         "end_date": end_date,
     }
 
-    with httpx.Client() as client:
-        response = client.get(url, headers=headers, params=params)
-        response.raise_for_status()  # Raises HTTPStatusError for 4xx/5xx responses
-        time_entries = response.json()
-        logger.info(f"Successfully retrieved {len(time_entries)} time entries")
-        return time_entries
+    response = await _get_client().get(url, headers=headers, params=params)
+    response.raise_for_status()  # Raises HTTPStatusError for 4xx/5xx responses
+    time_entries = response.json()
+    logger.info(f"Successfully retrieved {len(time_entries)} time entries")
+    return time_entries
 
 
-def get_toggl_track_activity_logs(
+async def get_toggl_track_activity_logs(
     start_date: str, end_date: str
 ) -> List[TogglTimeEntry]:
     """
@@ -108,6 +120,7 @@ def get_toggl_track_activity_logs(
 
     Retrieves time entries from Toggl API and deserializes them into TogglTimeEntry objects.
     Automatically fetches previous day entries that end on start_date (for overnight entries).
+    The previous day and the original date range are fetched concurrently.
 
     Args:
         start_date: Start date as ISO-8601 datetime string (e.g., 2026-01-01T00:00:00-08:00)
@@ -122,19 +135,21 @@ def get_toggl_track_activity_logs(
     # Step 1: Get previous day's date
     previous_date = get_previous_date(start_date)
 
-    # Step 2: Get time entries from previous day to start_date
-    previous_day_entries = _get_time_entries(previous_date, start_date)
+    # Step 2: Get time entries from previous day to start_date and raw time
+    # entries for the original date range, concurrently
+    previous_day_entries, time_entries = await asyncio.gather(
+        _get_time_entries(previous_date, start_date),
+        _get_time_entries(start_date, end_date),
+    )
 
     # Step 3: Filter entries that end on start_date
     filtered_previous_entries = _filter_entries_ending_on_date(
         previous_day_entries, start_date
     )
 
-    # Step 4: Get raw time entries from Toggl API for the original date range
-    time_entries = _get_time_entries(start_date, end_date)
-
-    # Step 5: Merge the two lists
+    # Step 4: Merge the two lists
     all_time_entries = filtered_previous_entries + time_entries
-    print(all_time_entries)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Merged Toggl time entries: {all_time_entries}")
 
     return deserialize_time_entries(all_time_entries)
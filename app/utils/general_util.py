@@ -1,33 +1,38 @@
-from datetime import datetime, timedelta
+from datetime import date as date_cls, datetime, timedelta
+from zoneinfo import ZoneInfo
 
+SEATTLE_TZ = ZoneInfo("America/Los_Angeles")
+UTC_TZ = ZoneInfo("UTC")
 
-def get_previous_date(date: str) -> str:
+
+def as_utc_if_naive(value: datetime) -> datetime:
     """
-    Get the previous day's date in the same format.
+    Treat naive datetimes as UTC so they can be compared with aware ones.
 
     Args:
-        date: ISO-8601 datetime string (e.g., 2026-01-01T00:00:00-08:00)
+        value: Naive or timezone-aware datetime
 
     Returns:
-        Previous day's date in the same ISO-8601 format
+        The datetime unchanged if aware, otherwise tagged as UTC
     """
-    date_normalized = date.replace("Z", "+00:00")
-    date_parsed = datetime.fromisoformat(date_normalized)
-    previous_date_obj = date_parsed - timedelta(days=1)
-    return previous_date_obj.isoformat()
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC_TZ)
+    return value
 
 
-def get_next_date(date: str) -> str:
+def get_previous_date(date: str) -> str:
     """
-    Get the next day's date in the same format.
+    Get the previous day's date in the same format.
+
+    Only the leading YYYY-MM-DD is shifted; the rest of the string (time and
+    offset, including a "Z" suffix) is kept exactly as given, and a date-only
+    input returns a date-only output.
 
     Args:
         date: ISO-8601 datetime string (e.g., 2026-01-01T00:00:00-08:00)
 
     Returns:
-        Next day's date in the same ISO-8601 format
+        Previous day's date in the same ISO-8601 format
     """
-    date_normalized = date.replace("Z", "+00:00")
-    date_parsed = datetime.fromisoformat(date_normalized)
-    next_date_obj = date_parsed + timedelta(days=1)
-    return next_date_obj.isoformat()
+    previous_date_obj = date_cls.fromisoformat(date[:10]) - timedelta(days=1)
+    return previous_date_obj.isoformat() + date[10:]
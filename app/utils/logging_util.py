@@ -0,0 +1,15 @@
+import logging
+
+
+def configure_logging() -> None:
+    """
+    Configure the root logger with the application's level and format.
+
+    Called at app startup and in PDF worker processes, which start without
+    the parent's logging configuration.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
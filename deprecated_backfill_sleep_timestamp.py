@@ -32,20 +32,11 @@ def _convert_timestamp(timestamp_format_a: Optional[int]) -> Optional[int]:
     """
     if timestamp_format_a is None:
         return None
-    timestamp_str = str(timestamp_format_a).strip()
-    if not timestamp_str or timestamp_str.lower() == "none":
-        return None
-    if len(timestamp_str) == 3:
-        hours = int(timestamp_str[0])
-        minutes = int(timestamp_str[1:])
-    elif len(timestamp_str) == 4:
-        hours = int(timestamp_str[:2])
-        minutes = int(timestamp_str[2:])
-    else:
+    # 3 or 4 digits: HMM or HHMM
+    if not 100 <= timestamp_format_a <= 9999:
         raise ValueError(f"Invalid timestamp format: {timestamp_format_a}. Expected 3 or 4 digits.")
-    if hours < 0:
-        raise ValueError(f"Invalid hours: {hours}. Must be non-negative.")
-    if minutes < 0 or minutes > 59:
+    hours, minutes = divmod(timestamp_format_a, 100)
+    if minutes > 59:
         raise ValueError(f"Invalid minutes: {minutes}. Must be between 0 and 59.")
     minutes_since_midnight = hours * 60 + minutes
     return minutes_since_midnight
@@ -107,8 +98,7 @@ def _publish_to_csv(timestamps: List[Optional[int]], output_path: Path) -> None:
     with open(output_path, "w", newline="") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["timestamp"])
-        for timestamp in timestamps:
-            writer.writerow([timestamp])
+        writer.writerows([timestamp] for timestamp in timestamps)
 
 
 def convert_timestamps(timestamps_format_a: List[Optional[int]], output_path: Path) -> List[Optional[int]]:
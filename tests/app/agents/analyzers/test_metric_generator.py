@@ -0,0 +1,17 @@
+import asyncio
+from unittest.mock import patch
+from app.agents.analyzers.metric_generator import generate_all_metrics
+
+
+class TestGenerateAllMetrics:
+    """Test cases for generate_all_metrics."""
+
+    @patch("app.agents.analyzers.metric_generator.responses")
+    def test_generate_all_metrics_skips_llm_for_empty_logs(self, mock_responses):
+        """Test that no LLM call is made when there are no activity logs."""
+        # Act
+        result = asyncio.run(generate_all_metrics("TotalWorkoutTimePerDay", []))
+
+        # Assert
+        assert result == []
+        mock_responses.assert_not_called()
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+from app.agents.prompts.metric_generator_prompts import _format_activity_logs
+from app.models.toggl import TogglTimeEntry
+
+
+class TestFormatActivityLogs:
+    """Test cases for _format_activity_logs."""
+
+    def test_format_activity_logs(self):
+        """Test that activity logs are formatted as numbered entries."""
+        # Arrange
+        activity_logs = [
+            TogglTimeEntry(
+                tags=["workout", "cardio"],
+                description="Run",
+                start=datetime(2026, 1, 1, 7, 0, tzinfo=timezone.utc),
+                stop=datetime(2026, 1, 1, 7, 30, tzinfo=timezone.utc),
+                duration=1800,
+            ),
+            TogglTimeEntry(
+                tags=[],
+                description="Lunch",
+                start=datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+                stop=datetime(2026, 1, 1, 12, 45, tzinfo=timezone.utc),
+                duration=2700,
+            ),
+        ]
+
+        # Act
+        result = _format_activity_logs(activity_logs)
+
+        # Assert
+        assert result == (
+            "Entry 1:\n"
+            "  - Tags: workout, cardio\n"
+            "  - Description: Run\n"
+            "  - Start: 2026-01-01T07:00:00+00:00\n"
+            "  - Stop: 2026-01-01T07:30:00+00:00\n"
+            "  - Duration: 1800 seconds (30.00 minutes)\n"
+            "\n"
+            "Entry 2:\n"
+            "  - Tags: None\n"
+            "  - Description: Lunch\n"
+            "  - Start: 2026-01-01T12:00:00+00:00\n"
+            "  - Stop: 2026-01-01T12:45:00+00:00\n"
+            "  - Duration: 2700 seconds (45.00 minutes)"
+        )
+
+    def test_format_activity_logs_distinguishes_timezones(self):
+        """Test that equal instants in different timezones are not served from cache."""
+        # Arrange
+        pst = timezone(timedelta(hours=-8))
+        utc_log = TogglTimeEntry(
+            tags=["sleep"],
+            description="Sleep",
+            start=datetime(2026, 1, 1, 8, 0, tzinfo=timezone.utc),
+            stop=datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc),
+            duration=3600,
+        )
+        pst_log = utc_log.model_copy(
+            update={
+                "start": utc_log.start.astimezone(pst),
+                "stop": utc_log.stop.astimezone(pst),
+            }
+        )
+
+        # Act
+        utc_result = _format_activity_logs([utc_log])
+        pst_result = _format_activity_logs([pst_log])
+
+        # Assert
+        assert "Start: 2026-01-01T08:00:00+00:00" in utc_result
+        assert "Start: 2026-01-01T00:00:00-08:00" in pst_result
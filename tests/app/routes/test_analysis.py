@@ -0,0 +1,85 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.routes import analysis
+
+
+def _build_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(analysis.router)
+    return TestClient(app)
+
+
+class TestCreateAnalysis:
+    """Test cases for the POST /analysis endpoint."""
+
+    def test_create_analysis_returns_serialized_response(self):
+        """Test that the endpoint returns the serialized CreateAnalysisResponse."""
+        # Arrange
+        client = _build_client()
+        body = {
+            "prompt": "Build a table",
+            "response_mode": "TABLE",
+            "activity_logs": [],
+        }
+
+        # Act
+        response = client.post("/analysis/", json=body)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        payload = response.json()
+        assert payload["raw_output"] == []
+        assert payload["output_config"]["s3_output_path"] == (
+            f"s3://daylytics/analysis/{payload['analysis_rid']}/output"
+        )
+
+    def test_create_analysis_rejects_invalid_request(self):
+        """Test that an invalid request body is rejected with 422."""
+        # Arrange
+        client = _build_client()
+        body = {
+            "prompt": "Build a table",
+            "response_mode": "CHART",
+            "activity_logs": [],
+        }
+
+        # Act
+        response = client.post("/analysis/", json=body)
+
+        # Assert
+        assert response.status_code == 422
+
+    def test_create_analysis_rejects_malformed_json(self):
+        """Test that a malformed JSON body is rejected with 422."""
+        # Arrange
+        client = _build_client()
+
+        # Act
+        response = client.post(
+            "/analysis/",
+            content=b'{"prompt": ',
+            headers={"content-type": "application/json"},
+        )
+
+        # Assert
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == "body"
+
+    def test_create_analysis_documents_request_body(self):
+        """Test that the request body schema is still published in OpenAPI."""
+        # Arrange
+        client = _build_client()
+
+        # Act
+        openapi = client.get("/openapi.json").json()
+
+        # Assert
+        request_body = openapi["paths"]["/analysis/"]["post"]["requestBody"]
+        schema = request_body["content"]["application/json"]["schema"]
+        assert set(schema["properties"]) == {
+            "prompt",
+            "response_mode",
+            "activity_logs",
+        }
+        assert "$ref" not in str(schema)
@@ -0,0 +1,259 @@
+import asyncio
+import csv
+import importlib
+import sys
+import types
+from datetime import date
+
+import pytest
+from app.models.activity import ActivityMetric, Period, Unit
+from app.models.analysis import CreateAnalysisResponse, OutputConfig
+from app.models.toggl import TogglTimeEntry
+
+
+@pytest.fixture
+def workflow(monkeypatch):
+    """The workflow route module, with the untracked personal prompt module stubbed."""
+    personal_prompt_module = types.ModuleType("personal_prompt_temporary")
+    personal_prompt_module.get_personal_prompt_temporary = lambda date: []
+    monkeypatch.setitem(
+        sys.modules, "personal_prompt_temporary", personal_prompt_module
+    )
+    return importlib.import_module("app.routes.workflow")
+
+
+def _build_log(start, stop, tags):
+    return TogglTimeEntry(
+        tags=tags, description="entry", start=start, stop=stop, duration=60
+    )
+
+
+def _build_response(metrics):
+    return CreateAnalysisResponse(
+        analysis_rid="rid",
+        output_config=OutputConfig(s3_output_path="s3://daylytics/analysis/rid/output"),
+        raw_output=[
+            ActivityMetric(
+                date=metric_date,
+                period=Period.ONE_DAY,
+                unit=Unit.MINS,
+                value=value,
+                title=title,
+                reason="",
+            )
+            for metric_date, title, value in metrics
+        ],
+    )
+
+
+class TestFilterActivityLogsForDate:
+    """Test cases for _filter_activity_logs_for_date."""
+
+    def test_filter_activity_logs_for_date_puts_overnight_logs_first(self, workflow):
+        """Test that logs ending on the target date from the day before come first."""
+        # Arrange
+        same_day = _build_log(
+            "2026-01-01T09:00:00-08:00", "2026-01-01T10:00:00-08:00", ["work"]
+        )
+        overnight = _build_log(
+            "2025-12-31T23:00:00-08:00", "2026-01-01T07:00:00-08:00", ["sleep"]
+        )
+        previous_day_only = _build_log(
+            "2025-12-31T08:00:00-08:00", "2025-12-31T09:00:00-08:00", ["work"]
+        )
+        logs_by_start_date = workflow._bucket_activity_logs_by_start_date(
+            [same_day, overnight, previous_day_only]
+        )
+
+        # Act
+        result = workflow._filter_activity_logs_for_date(
+            logs_by_start_date, date(2026, 1, 1)
+        )
+
+        # Assert
+        assert result == [overnight, same_day]
+
+    def test_filter_activity_logs_for_date_uses_seattle_dates(self, workflow):
+        """Test that UTC timestamps are bucketed by their Seattle calendar date."""
+        # Arrange
+        # 2026-01-02T05:00Z is 2026-01-01 21:00 in Seattle
+        late_evening = _build_log(
+            "2026-01-02T05:00:00+00:00", "2026-01-02T06:00:00+00:00", ["work"]
+        )
+        logs_by_start_date = workflow._bucket_activity_logs_by_start_date(
+            [late_evening]
+        )
+
+        # Act
+        result = workflow._filter_activity_logs_for_date(
+            logs_by_start_date, date(2026, 1, 1)
+        )
+
+        # Assert
+        assert result == [late_evening]
+
+
+class TestGetBedTimeLogsForNextDate:
+    """Test cases for _get_bed_time_logs_for_next_date."""
+
+    def test_get_bed_time_logs_for_next_date_only_before_noon(self, workflow):
+        """Test that only bed time logs starting before noon on the next date count."""
+        # Arrange
+        early_sleep = _build_log(
+            "2026-01-02T01:00:00-08:00", "2026-01-02T08:00:00-08:00", ["sleep"]
+        )
+        early_bed_time = _build_log(
+            "2026-01-02T00:30:00-08:00", "2026-01-02T01:00:00-08:00", ["bed_time"]
+        )
+        afternoon_nap = _build_log(
+            "2026-01-02T13:00:00-08:00", "2026-01-02T14:00:00-08:00", ["sleep"]
+        )
+        early_work = _build_log(
+            "2026-01-02T06:00:00-08:00", "2026-01-02T07:00:00-08:00", ["work"]
+        )
+        logs_by_start_date = workflow._bucket_activity_logs_by_start_date(
+            [early_sleep, early_bed_time, afternoon_nap, early_work]
+        )
+
+        # Act
+        result = workflow._get_bed_time_logs_for_next_date(
+            logs_by_start_date, date(2026, 1, 2)
+        )
+
+        # Assert
+        assert result == [early_sleep, early_bed_time]
+
+
+class TestWriteMetricsToCsv:
+    """Test cases for _merge_metrics_into_rows and _write_metrics_to_csv."""
+
+    def test_write_metrics_to_csv_sorts_rows_and_orders_columns(
+        self, workflow, tmp_path
+    ):
+        """Test that rows are written in date order with the fixed column order."""
+        # Arrange
+        csv_path = tmp_path / "output.csv"
+        rows_by_date = {}
+        all_column_names = {"Day"}
+        workflow._merge_metrics_into_rows(
+            _build_response(
+                [
+                    (date(2026, 1, 2), "CustomMetric", 3),
+                    (date(2026, 1, 2), "BedTimePerDay", 1),
+                ]
+            ),
+            rows_by_date,
+            all_column_names,
+        )
+        workflow._merge_metrics_into_rows(
+            _build_response([(date(2026, 1, 1), "WakeUpTimePerDay", 5)]),
+            rows_by_date,
+            all_column_names,
+        )
+
+        # Act
+        workflow._write_metrics_to_csv(csv_path, rows_by_date, all_column_names)
+
+        # Assert
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["Day", "WakeUpTimePerDay", "BedTimePerDay", "CustomMetric"],
+            ["01/01/2026", "5.0", "", ""],
+            ["01/02/2026", "", "1.0", "3.0"],
+        ]
+
+
+class TestStartWorkflow:
+    """Test cases for the start_workflow endpoint."""
+
+    def test_start_workflow_cancels_pending_analyses_on_failure(
+        self, workflow, monkeypatch
+    ):
+        """Test that one failed analysis cancels the analyses still running."""
+        # Arrange
+        log = _build_log(
+            "2026-01-01T09:00:00-08:00", "2026-01-01T10:00:00-08:00", ["work"]
+        )
+        finished_prompts = []
+
+        async def fake_get_logs(start_date, end_date):
+            return [log]
+
+        async def fake_create_analysis(analysis_request):
+            if analysis_request.prompt == "fail":
+                raise RuntimeError("analysis failed")
+            await asyncio.sleep(0.1)
+            finished_prompts.append(analysis_request.prompt)
+
+        monkeypatch.setattr(workflow, "get_toggl_track_activity_logs", fake_get_logs)
+        monkeypatch.setattr(
+            workflow,
+            "get_personal_prompt_temporary",
+            lambda date: ["fail", "slow_1", "slow_2", "slow_3", "slow_4"],
+        )
+        monkeypatch.setattr(workflow, "create_analysis", fake_create_analysis)
+        request = workflow.StartWorkflowRequest(
+            start_date="2026-01-01T00:00:00-08:00",
+            end_date="2026-01-01T00:00:00-08:00",
+        )
+
+        async def run_and_let_siblings_finish():
+            with pytest.raises(RuntimeError, match="analysis failed"):
+                await workflow.start_workflow(request)
+            await asyncio.sleep(0.2)
+
+        # Act
+        asyncio.run(run_and_let_siblings_finish())
+
+        # Assert
+        assert finished_prompts == []
+
+    def test_start_workflow_passes_each_date_to_prompts_and_filters(
+        self, workflow, monkeypatch, tmp_path
+    ):
+        """Test that the first date is passed verbatim and logs follow Seattle days."""
+        # Arrange
+        # 2026-01-01T08:00Z is midnight on 2026-01-01 in Seattle
+        first_day_log = _build_log(
+            "2026-01-01T10:00:00-08:00", "2026-01-01T11:00:00-08:00", ["work"]
+        )
+        second_day_log = _build_log(
+            "2026-01-02T10:00:00-08:00", "2026-01-02T11:00:00-08:00", ["work"]
+        )
+        prompt_dates = []
+        logs_by_prompt = {}
+
+        async def fake_get_logs(start_date, end_date):
+            return [first_day_log, second_day_log]
+
+        def fake_get_prompts(current_date):
+            prompt_dates.append(current_date)
+            return [current_date]
+
+        async def fake_create_analysis(analysis_request):
+            logs_by_prompt[analysis_request.prompt] = analysis_request.activity_logs
+            return CreateAnalysisResponse(
+                analysis_rid="rid",
+                output_config=OutputConfig(s3_output_path="s3://output"),
+            )
+
+        monkeypatch.setattr(workflow, "get_toggl_track_activity_logs", fake_get_logs)
+        monkeypatch.setattr(workflow, "get_personal_prompt_temporary", fake_get_prompts)
+        monkeypatch.setattr(workflow, "create_analysis", fake_create_analysis)
+        monkeypatch.setattr(workflow.Path, "home", lambda: tmp_path)
+        (tmp_path / "Desktop").mkdir()
+        request = workflow.StartWorkflowRequest(
+            start_date="2026-01-01T08:00:00Z",
+            end_date="2026-01-02T08:00:00Z",
+        )
+
+        # Act
+        asyncio.run(workflow.start_workflow(request))
+
+        # Assert
+        assert prompt_dates == ["2026-01-01T08:00:00Z", "2026-01-02T08:00:00+00:00"]
+        assert logs_by_prompt == {
+            "2026-01-01T08:00:00Z": [first_day_log],
+            "2026-01-02T08:00:00+00:00": [second_day_log],
+        }
@@ -0,0 +1,63 @@
+import pytest
+from zoneinfo import ZoneInfo
+from app.models.toggl import TogglTimeEntry
+from app.services.helpers.toggl_service_helper import deserialize_time_entries
+
+
+def _build_raw_entry(**overrides):
+    raw_entry = {
+        "id": 1,
+        "tags": ["workout"],
+        "description": "Run",
+        "start": "2026-01-01T15:00:00Z",
+        "stop": "2026-01-01T15:30:00Z",
+        "duration": 1800,
+        "project_id": 42,
+    }
+    raw_entry.update(overrides)
+    return raw_entry
+
+
+class TestDeserializeTimeEntries:
+    """Test cases for deserialize_time_entries."""
+
+    def test_deserialize_time_entries_converts_to_seattle_time(self):
+        """Test that UTC timestamps are converted to Seattle time."""
+        # Act
+        result = deserialize_time_entries([_build_raw_entry()])
+
+        # Assert
+        assert len(result) == 1
+        entry = result[0]
+        assert isinstance(entry, TogglTimeEntry)
+        assert entry.start.tzinfo == ZoneInfo("America/Los_Angeles")
+        assert entry.start.isoformat() == "2026-01-01T07:00:00-08:00"
+        assert entry.stop.isoformat() == "2026-01-01T07:30:00-08:00"
+        assert entry.duration == 1800
+
+    def test_deserialize_time_entries_treats_naive_timestamps_as_utc(self):
+        """Test that naive timestamps are interpreted as UTC."""
+        # Arrange
+        raw_entry = _build_raw_entry(
+            start="2026-07-01T15:00:00", stop="2026-07-01T16:00:00"
+        )
+
+        # Act
+        result = deserialize_time_entries([raw_entry])
+
+        # Assert
+        assert result[0].start.isoformat() == "2026-07-01T08:00:00-07:00"
+
+    def test_deserialize_time_entries_rejects_missing_fields(self):
+        """Test that entries missing required fields raise ValueError."""
+        # Arrange
+        raw_entry = _build_raw_entry(stop=None)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="missing required fields: stop"):
+            deserialize_time_entries([raw_entry])
+
+    def test_deserialize_time_entries_empty(self):
+        """Test that an empty list deserializes to an empty list."""
+        # Act & Assert
+        assert deserialize_time_entries([]) == []
@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from app.models.analysis import CreateAnalysisRequest, ResponseMode
+from app.services import analysis_service
+
+
+@pytest.fixture(autouse=True)
+def clear_raw_output_cache():
+    analysis_service._raw_output_cache.clear()
+    yield
+    analysis_service._raw_output_cache.clear()
+
+
+def _build_request(prompt: str) -> CreateAnalysisRequest:
+    return CreateAnalysisRequest(
+        prompt=prompt, response_mode=ResponseMode.TABLE, activity_logs=[]
+    )
+
+
+class TestCreateAnalysis:
+    """Test cases for analysis_service.create_analysis."""
+
+    @patch("app.services.analysis_service.generate_table")
+    def test_create_analysis_reuses_cached_output(self, mock_generate_table):
+        """Test that identical requests reuse raw output but get distinct RIDs."""
+        # Arrange
+        mock_generate_table.return_value = [{"row": 1}]
+
+        # Act
+        first = asyncio.run(analysis_service.create_analysis(_build_request("table")))
+        second = asyncio.run(analysis_service.create_analysis(_build_request("table")))
+
+        # Assert
+        mock_generate_table.assert_called_once()
+        assert second.raw_output == [{"row": 1}]
+        assert first.analysis_rid != second.analysis_rid
+
+    @patch("app.services.analysis_service.generate_table")
+    def test_create_analysis_misses_cache_for_different_prompt(
+        self, mock_generate_table
+    ):
+        """Test that requests with different prompts are analyzed separately."""
+        # Arrange
+        mock_generate_table.return_value = []
+
+        # Act
+        asyncio.run(analysis_service.create_analysis(_build_request("table")))
+        asyncio.run(analysis_service.create_analysis(_build_request("another table")))
+
+        # Assert
+        assert mock_generate_table.call_count == 2
+
+    @patch("app.services.analysis_service.time.monotonic")
+    @patch("app.services.analysis_service.generate_table")
+    def test_create_analysis_expires_cached_output(
+        self, mock_generate_table, mock_monotonic
+    ):
+        """Test that cached output is regenerated after the TTL elapses."""
+        # Arrange
+        mock_generate_table.return_value = []
+        mock_monotonic.return_value = 0.0
+
+        # Act
+        asyncio.run(analysis_service.create_analysis(_build_request("table")))
+        mock_monotonic.return_value = 10_000.0
+        asyncio.run(analysis_service.create_analysis(_build_request("table")))
+
+        # Assert
+        assert mock_generate_table.call_count == 2
+
+    @patch("app.services.analysis_service.settings")
+    @patch("app.services.analysis_service.generate_table")
+    def test_create_analysis_evicts_least_recently_used(
+        self, mock_generate_table, mock_settings
+    ):
+        """Test that the cache never grows beyond its configured size."""
+        # Arrange
+        mock_generate_table.return_value = []
+        mock_settings.analysis_cache_max_entries = 1
+        mock_settings.analysis_cache_ttl_seconds = 300.0
+
+        # Act
+        asyncio.run(analysis_service.create_analysis(_build_request("first")))
+        asyncio.run(analysis_service.create_analysis(_build_request("second")))
+        asyncio.run(analysis_service.create_analysis(_build_request("first")))
+
+        # Assert
+        assert len(analysis_service._raw_output_cache) == 1
+        assert mock_generate_table.call_count == 3
@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from openai import RateLimitError  # type: ignore[import-untyped]
+from app.services import openai_service
+
+
+def _build_rate_limit_error(headers=None) -> RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    response = httpx.Response(429, headers=headers or {}, request=request)
+    return RateLimitError("Rate limit reached", response=response, body=None)
+
+
+def _build_client(create: AsyncMock) -> MagicMock:
+    client = MagicMock()
+    client.responses.create = create
+    return client
+
+
+class TestResponses:
+    """Test cases for openai_service.responses."""
+
+    @patch("app.services.openai_service.asyncio.sleep", new_callable=AsyncMock)
+    @patch("app.services.openai_service._get_client")
+    def test_responses_honours_retry_after_header(self, mock_get_client, mock_sleep):
+        """Test that a rate limited call waits for the server-suggested delay."""
+        # Arrange
+        create = AsyncMock(
+            side_effect=[
+                _build_rate_limit_error({"retry-after": "2"}),
+                MagicMock(output_text="ok"),
+            ]
+        )
+        mock_get_client.return_value = _build_client(create)
+
+        # Act
+        result = asyncio.run(openai_service.responses("gpt-5-mini", "prompt"))
+
+        # Assert
+        assert result == {"output_text": "ok"}
+        assert create.await_count == 2
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.parametrize("retry_after", ["3600", "inf"])
+    @patch("app.services.openai_service.asyncio.sleep", new_callable=AsyncMock)
+    @patch("app.services.openai_service._get_client")
+    def test_responses_caps_retry_after_header(
+        self, mock_get_client, mock_sleep, retry_after
+    ):
+        """Test that an oversized Retry-After hint is capped."""
+        # Arrange
+        create = AsyncMock(
+            side_effect=[
+                _build_rate_limit_error({"retry-after": retry_after}),
+                MagicMock(output_text="ok"),
+            ]
+        )
+        mock_get_client.return_value = _build_client(create)
+
+        # Act
+        asyncio.run(openai_service.responses("gpt-5-mini", "prompt"))
+
+        # Assert
+        mock_sleep.assert_awaited_once_with(openai_service.MAX_RETRY_AFTER_SECONDS)
+
+    @patch("app.services.openai_service.asyncio.sleep", new_callable=AsyncMock)
+    @patch("app.services.openai_service._get_client")
+    def test_responses_raises_after_retries_exhausted(
+        self, mock_get_client, mock_sleep
+    ):
+        """Test that the last rate limit error is raised once retries run out."""
+        # Arrange
+        create = AsyncMock(side_effect=_build_rate_limit_error())
+        mock_get_client.return_value = _build_client(create)
+
+        # Act & Assert
+        with pytest.raises(RateLimitError):
+            asyncio.run(openai_service.responses("gpt-5-mini", "prompt"))
+        assert create.await_count == openai_service.MAX_RETRIES + 1
+        assert mock_sleep.await_count == openai_service.MAX_RETRIES
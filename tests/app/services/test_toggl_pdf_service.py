@@ -0,0 +1,158 @@
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.services import toggl_pdf_service
+from app.services.toggl_pdf_service import (
+    _extract_raw_entries,
+    _iter_table_rows,
+    _parse_time_date_column,
+    _to_timestamp,
+)
+
+
+def _build_pdf(pages):
+    """Build a stand-in for an open pdfplumber PDF from per-page table rows."""
+    return SimpleNamespace(
+        pages=[
+            SimpleNamespace(
+                find_tables=lambda tables=tables: [
+                    SimpleNamespace(extract=lambda rows=rows: rows) for rows in tables
+                ]
+            )
+            for tables in pages
+        ]
+    )
+
+
+class TestParseTimeDateColumn:
+    """Test cases for _parse_time_date_column."""
+
+    def test_parse_time_date_column_spanning_midnight(self):
+        """Test that an entry spanning midnight stops on the second date."""
+        # Act
+        result = _parse_time_date_column("21:42 - 06:15\n10/26/2025 - 10/27/2025")
+
+        # Assert
+        assert result == ("2025-10-26T21:42:00-07:00", "2025-10-27T06:15:00-07:00")
+
+    def test_parse_time_date_column_single_date(self):
+        """Test that a single date is used for both start and stop."""
+        # Act
+        result = _parse_time_date_column("19:58 - 20:14\n10/26/2025")
+
+        # Assert
+        assert result == ("2025-10-26T19:58:00-07:00", "2025-10-26T20:14:00-07:00")
+
+    def test_parse_time_date_column_uses_seattle_offset_for_date(self):
+        """Test that the Seattle offset follows DST for the given date."""
+        # Act
+        result = _parse_time_date_column("8:05 - 9:30\n1/5/2026")
+
+        # Assert
+        assert result == ("2026-01-05T08:05:00-08:00", "2026-01-05T09:30:00-08:00")
+
+    @pytest.mark.parametrize(
+        "time_date_str",
+        [
+            "",
+            "10/26/2025",
+            "19:58 - 20:14",
+            "19:58 -\n20:14\n10/26/2025",
+            "19:58 - 20:14\n2025-10-26",
+        ],
+    )
+    def test_parse_time_date_column_rejects_malformed_cell(self, time_date_str):
+        """Test that malformed cells raise ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            _parse_time_date_column(time_date_str)
+
+
+class TestIterTableRows:
+    """Test cases for _iter_table_rows."""
+
+    def test_iter_table_rows_skips_headers_and_empty_pages(self):
+        """Test that header rows and pages without tables are skipped."""
+        # Arrange
+        pdf = _build_pdf(
+            [
+                [],
+                [[["DESCRIPTION"], ["Run"], ["Read"]], [["DESCRIPTION"]]],
+                [[["DESCRIPTION"], ["Sleep"]]],
+            ]
+        )
+
+        # Act
+        result = list(_iter_table_rows(pdf))
+
+        # Assert
+        assert result == [(2, ["Run"]), (2, ["Read"]), (3, ["Sleep"])]
+
+
+class TestToTimestamp:
+    """Test cases for _to_timestamp."""
+
+    def test_to_timestamp_treats_naive_as_utc(self):
+        """Test that a naive datetime is read as UTC."""
+        # Act
+        result = _to_timestamp(datetime(1970, 1, 2))
+
+        # Assert
+        assert result == 86400.0
+
+    def test_to_timestamp_uses_aware_offset(self):
+        """Test that an aware datetime keeps its own offset."""
+        # Act
+        result = _to_timestamp(datetime.fromisoformat("1970-01-01T16:00:00-08:00"))
+
+        # Assert
+        assert result == 86400.0
+
+
+class TestExtractRawEntries:
+    """Test cases for _extract_raw_entries."""
+
+    @patch("app.services.toggl_pdf_service.ProcessPoolExecutor")
+    @patch("app.services.toggl_pdf_service.os.cpu_count", return_value=4)
+    @patch("app.services.toggl_pdf_service._count_pages", return_value=3)
+    @patch("app.services.toggl_pdf_service._get_time_entries_from_pdf")
+    def test_extract_raw_entries_parses_small_batches_in_process(
+        self, mock_get_entries, mock_count_pages, mock_cpu_count, mock_executor
+    ):
+        """Test that batches below the page threshold skip the process pool."""
+        # Arrange
+        mock_get_entries.side_effect = lambda path: [{"path": str(path)}]
+        pdf_paths = [Path("a.pdf"), Path("b.pdf")]
+
+        # Act
+        result = _extract_raw_entries(pdf_paths)
+
+        # Assert
+        assert result == [[{"path": "a.pdf"}], [{"path": "b.pdf"}]]
+        mock_executor.assert_not_called()
+
+    @patch("app.services.toggl_pdf_service.ProcessPoolExecutor")
+    @patch("app.services.toggl_pdf_service.os.cpu_count", return_value=4)
+    @patch("app.services.toggl_pdf_service._count_pages")
+    def test_extract_raw_entries_uses_pool_with_logging_for_large_batches(
+        self, mock_count_pages, mock_cpu_count, mock_executor
+    ):
+        """Test that large batches use a pool whose workers configure logging."""
+        # Arrange
+        mock_count_pages.return_value = toggl_pdf_service._PROCESS_POOL_MIN_PAGES
+        executor = MagicMock()
+        executor.map.return_value = iter([[], []])
+        mock_executor.return_value.__enter__.return_value = executor
+        pdf_paths = [Path("a.pdf"), Path("b.pdf")]
+
+        # Act
+        result = _extract_raw_entries(pdf_paths)
+
+        # Assert
+        assert result == [[], []]
+        _, kwargs = mock_executor.call_args
+        assert kwargs["max_workers"] == 2
+        assert kwargs["initializer"] is toggl_pdf_service.configure_logging
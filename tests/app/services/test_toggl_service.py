@@ -0,0 +1,83 @@
+from app.services.toggl_service import _filter_entries_ending_on_date
+
+
+def _build_entries(*stops):
+    return [{"id": index, "stop": stop} for index, stop in enumerate(stops)]
+
+
+def _stops(entries):
+    return [entry["stop"] for entry in entries]
+
+
+class TestFilterEntriesEndingOnDate:
+    """Test cases for _filter_entries_ending_on_date."""
+
+    def test_filter_entries_ending_on_date_spring_forward(self):
+        """Test the 23-hour Seattle day when DST starts (2026-03-08)."""
+        # Arrange
+        entries = _build_entries(
+            "2026-03-07T23:59:00-08:00",
+            "2026-03-08T00:00:00-08:00",
+            "2026-03-08T03:00:00-07:00",
+            "2026-03-08T23:59:00-07:00",
+            "2026-03-09T00:00:00-07:00",
+        )
+
+        # Act
+        result = _filter_entries_ending_on_date(entries, "2026-03-08T00:00:00-08:00")
+
+        # Assert
+        assert _stops(result) == [
+            "2026-03-08T00:00:00-08:00",
+            "2026-03-08T03:00:00-07:00",
+            "2026-03-08T23:59:00-07:00",
+        ]
+
+    def test_filter_entries_ending_on_date_fall_back(self):
+        """Test the 25-hour Seattle day when DST ends (2026-11-01)."""
+        # Arrange
+        entries = _build_entries(
+            "2026-10-31T23:59:00-07:00",
+            "2026-11-01T01:30:00-07:00",
+            "2026-11-01T01:30:00-08:00",
+            "2026-11-01T23:59:00-08:00",
+            "2026-11-02T00:00:00-08:00",
+        )
+
+        # Act
+        result = _filter_entries_ending_on_date(entries, "2026-11-01T00:00:00-07:00")
+
+        # Assert
+        assert _stops(result) == [
+            "2026-11-01T01:30:00-07:00",
+            "2026-11-01T01:30:00-08:00",
+            "2026-11-01T23:59:00-08:00",
+        ]
+
+    def test_filter_entries_ending_on_date_naive_target_is_utc(self):
+        """Test that a naive target date is read as UTC before taking the Seattle day."""
+        # Arrange
+        # 2026-01-01T12:00 UTC is 04:00 on 2026-01-01 in Seattle
+        entries = _build_entries(
+            "2026-01-01T07:59:00Z",
+            "2026-01-01T08:00:00Z",
+            "2026-01-02T07:59:00",
+            "2026-01-02T08:00:00Z",
+        )
+
+        # Act
+        result = _filter_entries_ending_on_date(entries, "2026-01-01T12:00:00")
+
+        # Assert
+        assert _stops(result) == ["2026-01-01T08:00:00Z", "2026-01-02T07:59:00"]
+
+    def test_filter_entries_ending_on_date_skips_unparseable_stop(self):
+        """Test that entries with a missing or invalid stop time are dropped."""
+        # Arrange
+        entries = _build_entries("", "not a date", "2026-01-01T10:00:00-08:00")
+
+        # Act
+        result = _filter_entries_ending_on_date(entries, "2026-01-01T00:00:00-08:00")
+
+        # Assert
+        assert _stops(result) == ["2026-01-01T10:00:00-08:00"]
@@ -1,7 +1,7 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from pydantic import ValidationError
+from unittest.mock import patch
 from app.config import Settings
-from app.dagger.aws_clients import AWSClients
 
 
 class TestSettings:
@@ -32,13 +32,30 @@ class TestSettings:
             settings.encrypted_toggl_password
             == "AQICAHg7rDJp72oZrIfl2vnBxkvlcidlgcJm7juguFV/iuWU+AE4eTN/RRoNeohMlPfTWPWHAAAAaDBmBgkqhkiG9w0BBwagWTBXAgEAMFIGCSqGSIb3DQEHATAeBglghkgBZQMEAS4wEQQMqnQxOt64OqXCnPDdAgEQgCUkBJGegvNMFYl/+4PITgXcf7NE33uhUzYWRPcCORfVdXjFNxSS"
         )
+        assert settings.analysis_cache_max_entries == 1024
+        assert settings.analysis_cache_ttl_seconds == 300.0
+        assert settings.workflow_max_concurrency == 16
         assert settings._aws_clients is None
 
+    @pytest.mark.parametrize(
+        "field_name,value",
+        [
+            ("analysis_cache_max_entries", -1),
+            ("analysis_cache_ttl_seconds", 0),
+            ("workflow_max_concurrency", 0),
+        ],
+    )
+    def test_settings_rejects_out_of_range_values(self, field_name, value):
+        """Test that Settings rejects cache and concurrency values out of range."""
+        # Act & Assert
+        with pytest.raises(ValidationError, match=field_name):
+            Settings(**{field_name: value})
+
     def test_set_aws_clients(self):
         """Test that set_aws_clients stores AWS clients correctly."""
         # Arrange
         settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
+        mock_aws_clients = object()
 
         # Act
         settings.set_aws_clients(mock_aws_clients)
@@ -50,8 +67,8 @@ class TestSettings:
         """Test that set_aws_clients can update existing AWS clients."""
         # Arrange
         settings = Settings()
-        mock_aws_clients_1 = MagicMock(spec=AWSClients)
-        mock_aws_clients_2 = MagicMock(spec=AWSClients)
+        mock_aws_clients_1 = object()
+        mock_aws_clients_2 = object()
 
         # Act
         settings.set_aws_clients(mock_aws_clients_1)
@@ -62,64 +79,43 @@ class TestSettings:
         assert settings._aws_clients is not mock_aws_clients_1
 
 
-class TestTogglProperties:
-    """Test cases for Toggl decrypted properties."""
-
-    @patch("app.config.Settings.decrypt_value")
-    def test_toggl_api_token_property(self, mock_decrypt_value):
-        """Test that toggl_api_token property calls decrypt_value correctly."""
-        # Arrange
-        settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
-        settings.set_aws_clients(mock_aws_clients)
-        expected_decrypted = "decrypted_api_token"
-        mock_decrypt_value.return_value = expected_decrypted
-
-        # Act
-        result = settings.toggl_api_token
-
-        # Assert
-        assert result == expected_decrypted
-        mock_decrypt_value.assert_called_once_with(
-            settings.encrypted_toggl_api_token, mock_aws_clients, settings.kms_key_arn
-        )
-
-    @patch("app.config.Settings.decrypt_value")
-    def test_toggl_email_property(self, mock_decrypt_value):
-        """Test that toggl_email property calls decrypt_value correctly."""
-        # Arrange
-        settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
-        settings.set_aws_clients(mock_aws_clients)
-        expected_decrypted = "decrypted_email"
-        mock_decrypt_value.return_value = expected_decrypted
+@pytest.fixture
+def configured_settings():
+    """Settings with AWS clients already set."""
+    settings = Settings()
+    settings.set_aws_clients(object())
+    return settings
 
-        # Act
-        result = settings.toggl_email
 
-        # Assert
-        assert result == expected_decrypted
-        mock_decrypt_value.assert_called_once_with(
-            settings.encrypted_toggl_email, mock_aws_clients, settings.kms_key_arn
-        )
+class TestTogglProperties:
+    """Test cases for Toggl decrypted properties."""
 
+    @pytest.mark.parametrize(
+        "property_name,encrypted_attr",
+        [
+            ("toggl_api_token", "encrypted_toggl_api_token"),
+            ("toggl_email", "encrypted_toggl_email"),
+            ("toggl_password", "encrypted_toggl_password"),
+        ],
+    )
     @patch("app.config.Settings.decrypt_value")
-    def test_toggl_password_property(self, mock_decrypt_value):
-        """Test that toggl_password property calls decrypt_value correctly."""
+    def test_toggl_property(
+        self, mock_decrypt_value, configured_settings, property_name, encrypted_attr
+    ):
+        """Test that each Toggl property calls decrypt_value correctly."""
         # Arrange
-        settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
-        settings.set_aws_clients(mock_aws_clients)
-        expected_decrypted = "decrypted_password"
+        expected_decrypted = f"decrypted_{property_name}"
         mock_decrypt_value.return_value = expected_decrypted
 
         # Act
-        result = settings.toggl_password
+        result = getattr(configured_settings, property_name)
 
         # Assert
         assert result == expected_decrypted
         mock_decrypt_value.assert_called_once_with(
-            settings.encrypted_toggl_password, mock_aws_clients, settings.kms_key_arn
+            getattr(configured_settings, encrypted_attr),
+            configured_settings._aws_clients,
+            configured_settings.kms_key_arn,
         )
 
     @patch("app.config.Settings.decrypt_value")
@@ -127,7 +123,7 @@ class TestTogglProperties:
         """Test that all properties use the stored _aws_clients instance."""
         # Arrange
         settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
+        mock_aws_clients = object()
         settings.set_aws_clients(mock_aws_clients)
         mock_decrypt_value.return_value = "decrypted_value"
 
@@ -149,7 +145,7 @@ class TestTogglProperties:
         """Test that all properties use the correct kms_key_arn from settings."""
         # Arrange
         settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
+        mock_aws_clients = object()
         settings.set_aws_clients(mock_aws_clients)
         mock_decrypt_value.return_value = "decrypted_value"
 
@@ -166,44 +162,22 @@ class TestTogglProperties:
                 args[2] == settings.kms_key_arn
             )  # Third argument should be kms_key_arn
 
+    @pytest.mark.parametrize(
+        "property_name,error",
+        [
+            ("toggl_api_token", ValueError("Decryption failed")),
+            ("toggl_email", RuntimeError("KMS client error")),
+            ("toggl_password", Exception("Unexpected error")),
+        ],
+    )
     @patch("app.config.Settings.decrypt_value")
-    def test_toggl_api_token_property_bubbles_error(self, mock_decrypt_value):
-        """Test that toggl_api_token property bubbles up errors from decrypt_value."""
-        # Arrange
-        settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
-        settings.set_aws_clients(mock_aws_clients)
-        test_error = ValueError("Decryption failed")
-        mock_decrypt_value.side_effect = test_error
-
-        # Act & Assert
-        with pytest.raises(ValueError, match="Decryption failed"):
-            _ = settings.toggl_api_token
-
-    @patch("app.config.Settings.decrypt_value")
-    def test_toggl_email_property_bubbles_error(self, mock_decrypt_value):
-        """Test that toggl_email property bubbles up errors from decrypt_value."""
-        # Arrange
-        settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
-        settings.set_aws_clients(mock_aws_clients)
-        test_error = RuntimeError("KMS client error")
-        mock_decrypt_value.side_effect = test_error
-
-        # Act & Assert
-        with pytest.raises(RuntimeError, match="KMS client error"):
-            _ = settings.toggl_email
-
-    @patch("app.config.Settings.decrypt_value")
-    def test_toggl_password_property_bubbles_error(self, mock_decrypt_value):
-        """Test that toggl_password property bubbles up errors from decrypt_value."""
+    def test_toggl_property_bubbles_error(
+        self, mock_decrypt_value, configured_settings, property_name, error
+    ):
+        """Test that each Toggl property bubbles up errors from decrypt_value."""
         # Arrange
-        settings = Settings()
-        mock_aws_clients = MagicMock(spec=AWSClients)
-        settings.set_aws_clients(mock_aws_clients)
-        test_error = Exception("Unexpected error")
-        mock_decrypt_value.side_effect = test_error
+        mock_decrypt_value.side_effect = error
 
         # Act & Assert
-        with pytest.raises(Exception, match="Unexpected error"):
-            _ = settings.toggl_password
+        with pytest.raises(type(error), match=str(error)):
+            getattr(configured_settings, property_name)
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+from app.utils.general_util import UTC_TZ, as_utc_if_naive, get_previous_date
+
+
+class TestGetPreviousDate:
+    """Test cases for get_previous_date."""
+
+    @pytest.mark.parametrize(
+        "date,expected",
+        [
+            ("2026-03-01T00:00:00-08:00", "2026-02-28T00:00:00-08:00"),
+            ("2026-01-01T00:00:00-08:00", "2025-12-31T00:00:00-08:00"),
+            ("2024-03-01T12:30:00+05:30", "2024-02-29T12:30:00+05:30"),
+        ],
+    )
+    def test_get_previous_date_rolls_over(self, date, expected):
+        """Test month, year and leap-day rollover with an explicit offset."""
+        # Act
+        result = get_previous_date(date)
+
+        # Assert
+        assert result == expected
+
+    def test_get_previous_date_keeps_z_suffix(self):
+        """Test that a "Z" suffix is preserved rather than rewritten to +00:00."""
+        # Act
+        result = get_previous_date("2026-01-01T08:00:00Z")
+
+        # Assert
+        assert result == "2025-12-31T08:00:00Z"
+
+    def test_get_previous_date_date_only(self):
+        """Test that a date-only input returns a date-only output."""
+        # Act
+        result = get_previous_date("2026-01-01")
+
+        # Assert
+        assert result == "2025-12-31"
+
+
+class TestAsUtcIfNaive:
+    """Test cases for as_utc_if_naive."""
+
+    def test_as_utc_if_naive_tags_naive_datetime(self):
+        """Test that a naive datetime is tagged as UTC."""
+        # Act
+        result = as_utc_if_naive(datetime(2026, 1, 1, 8, 0))
+
+        # Assert
+        assert result == datetime(2026, 1, 1, 8, 0, tzinfo=UTC_TZ)
+        assert result.tzinfo is UTC_TZ
+
+    def test_as_utc_if_naive_keeps_aware_datetime(self):
+        """Test that an aware datetime is returned unchanged."""
+        # Arrange
+        value = datetime.fromisoformat("2026-01-01T00:00:00-08:00")
+
+        # Act
+        result = as_utc_if_naive(value)
+
+        # Assert
+        assert result is value